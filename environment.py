@@ -1,12 +1,15 @@
 import numpy as np
-import pandas as pd
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, List, Dict, Optional
 from datetime import datetime, timedelta
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 # Has household class that holds states of houses, and appliance that can be added to house
 
+@dataclass(slots=True)
 class Appliance:
     name: str
     powerkW: float
@@ -21,6 +24,7 @@ class Appliance:
         return self.powerkW * self.durationHours
 
     
+@dataclass(slots=True)
 class HVACSystem:
     """HVAC system with comfort constraints"""
     currentTemp: float = 72.0  # Fahrenheit
@@ -36,6 +40,9 @@ class HVACSystem:
 
 class TOUPricing:
     """Time-of-Use pricing structure"""
+
+    # Schedules depend only on pricing type, so build each one once
+    _SCHEDULE_CACHE: Dict[str, tuple] = {}
     
     def __init__(self, pricingType: str = "standard"):
         """
@@ -45,54 +52,61 @@ class TOUPricing:
             pricing_type: "standard", "summer", or "winter"
         """
         self.pricingType = pricingType
-        self.prices = self._create_pricing_schedule()
+        schedule = self._SCHEDULE_CACHE.get(pricingType)
+        if schedule is None:
+            schedule = tuple(self._create_pricing_schedule())
+            self._SCHEDULE_CACHE[pricingType] = schedule
+        self.prices = list(schedule)
+        self.prices_arr = np.asarray(self.prices, dtype=np.float64)
     
-    def _create_pricing_schedule(self) -> Dict[int, float]:
-        """Create 24-hour pricing schedule"""
-        if self.pricing_type == "standard":
+    def _create_pricing_schedule(self) -> List[float]:
+        """Create 24-hour pricing schedule, indexed by hour"""
+        if self.pricingType == "standard":
             # Standard TOU: Peak 4pm-9pm, Off-peak midnight-6am
-            prices = {}
+            prices = []
             for hour in range(24):
                 if 0 <= hour < 6:  # Off-peak 
-                    prices[hour] = 0.08
+                    prices.append(0.08)
                 elif 16 <= hour < 21:  # Peak (4pm-9pm)
-                    prices[hour] = 0.32
+                    prices.append(0.32)
                 else:  # Mid-peak
-                    prices[hour] = 0.15
+                    prices.append(0.15)
             return prices
         
-        elif self.pricing_type == "summer":
+        elif self.pricingType == "summer":
             # Summer: Higher peak prices, longer peak hours
-            prices = {}
+            prices = []
             for hour in range(24):
                 if 0 <= hour < 6:
-                    prices[hour] = 0.09
+                    prices.append(0.09)
                 elif 14 <= hour < 22:  # Peak 2pm-10pm
-                    prices[hour] = 0.38
+                    prices.append(0.38)
                 else:
-                    prices[hour] = 0.17
+                    prices.append(0.17)
             return prices
         
         else:  # winter
-            prices = {}
+            prices = []
             for hour in range(24):
                 if 0 <= hour < 6:
-                    prices[hour] = 0.07
+                    prices.append(0.07)
                 elif 17 <= hour < 20:  # Peak 5pm-8pm
-                    prices[hour] = 0.28
+                    prices.append(0.28)
                 else:
-                    prices[hour] = 0.14
+                    prices.append(0.14)
             return prices
     
     def get_price(self, hour: int) -> float:
         """Get price for a specific hour"""
         return self.prices[hour % 24]
     
-    def get_daily_schedule(self) -> pd.DataFrame:
+    def get_daily_schedule(self) -> "pd.DataFrame":
         """Get full day pricing as DataFrame"""
+        import pandas as pd
+
         return pd.DataFrame({
             'hour': list(range(24)),
-            'price': [self.prices[h] for h in range(24)]
+            'price': list(self.prices)
         })
 
 
@@ -145,5 +159,5 @@ class Household:
     def schedule_appliance(self, appliance: Appliance, start_hour: int):
         """Schedule an appliance to start at a specific hour"""
         appliance.isScheduled = True
-        appliance.scheduled_start = start_hour
+        appliance.scheduledStart = start_hour
     
\ No newline at end of file